@@ -30,3 +30,9 @@ class GLWidget(QWindow):
 
     def mouseDoubleClickEvent(self, event):
         self.parent.toggle_fs.emit()
+
+    def keyPressEvent(self, event):
+        self.parent.keyPressEvent(event)
+
+    def keyReleaseEvent(self, event):
+        self.parent.keyReleaseEvent(event)
@@ -18,17 +18,13 @@ import os
 
 from PyQt6.QtGui import QKeySequence, QOpenGLContext, QAction, QActionGroup
 from PyQt6.QtWidgets import QApplication, QMainWindow, QLabel, QFileDialog, QStackedWidget, QSizePolicy, QWidget, QDialog
-from PyQt6.QtCore import Qt, QTimer, QFileInfo, QEvent, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import Qt, QTimer, QFileInfo, pyqtSignal, pyqtSlot
 
 from m64py.core.defs import *
-from m64py.frontend.dialogs import *
 from m64py.archive import EXT_FILTER
 from m64py.frontend.log import logview
 from m64py.frontend.view import View
-from m64py.frontend.cheat import Cheat
 from m64py.frontend.worker import Worker
-from m64py.frontend.rominfo import RomInfo
-from m64py.frontend.romlist import ROMList
 from m64py.frontend.settings import Settings
 from m64py.frontend.glwidget import GLWidget
 from m64py.frontend.vkwidget import VKWidget
@@ -38,6 +34,14 @@ from m64py.frontend.keymap import QT2SDL2
 from m64py.ui import icons_rc
 from m64py.ui import images_rc
 
+_QT2SDL2_INT = {key.value: scancode for key, scancode in QT2SDL2.items()}
+_KEY_ENTER = Qt.Key.Key_Enter.value
+_KEY_RETURN = Qt.Key.Key_Return.value
+_ALT_MODIFIER = Qt.KeyboardModifier.AltModifier.value
+
+# Delays in ms between core initialization checks, about 10 seconds in total
+_INITIALIZE_DELAYS = (50, 100, 200, 400, 800) + (1000,) * 9
+
 
 class MainWindow(QMainWindow, Ui_MainWindow):
     """Frontend main window"""
@@ -63,6 +67,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         self._initialized = False
         self._initialize_attempt = 0
+        self._last_state_tuple = None
 
         logview.setParent(self)
         logview.setWindowFlags(Qt.WindowType.Dialog)
@@ -71,12 +76,20 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.statusbar_label.setIndent(2)
         self.statusbar_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Fixed)
         self.statusbar.addPermanentWidget(self.statusbar_label, 1)
+
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(16)
+        self._status_timer.timeout.connect(self._flush_status)
+
         self.update_status(self.tr("M64Py version %s." % FRONTEND_VERSION))
 
         self.sizes = {
             SIZE_1X: self.action1X,
             SIZE_2X: self.action2X,
             SIZE_3X: self.action3X}
+        self._size_actions_tuple = tuple(self.sizes.values())
 
         self.slots = {}
         self.stack = None
@@ -87,6 +100,15 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.glwidget = None
         self.vkwidget = None
 
+        self._resizing = False
+        self._pending_size = None
+        self._last_video_size = None
+        self._user_data_save_dir = None
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._apply_pending_resize)
+
         self.settings = Settings(self)
         self.worker = Worker(self)
 
@@ -95,10 +117,6 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.create_state_slots()
         self.create_widgets()
 
-        self.installEventFilter(self)
-        self.installEventFilter(self.glwidget)
-        self.installEventFilter(self.vkwidget)
-
         self.recent_files = RecentFiles(self)
         self.connect_signals()
         self.worker.init()
@@ -116,64 +134,86 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             self.create_size_actions()
             self.center_widget()
 
-    def eventFilter(self, source, event):
-        if event.type() == QEvent.Type.KeyPress:
-            if self.worker.state not in (M64EMU_RUNNING, M64EMU_PAUSED):
-                return False
-            key = event.key()
-            modifiers = event.modifiers()
-            if modifiers & Qt.KeyboardModifier.AltModifier and (key == Qt.Key.Key_Enter or key == Qt.Key.Key_Return):
-                self.toggle_fs.emit()
-            else:
-                if key in QT2SDL2:
-                    self.worker.send_sdl_keydown(QT2SDL2[key])
-            return True
-        elif event.type() == QEvent.Type.KeyRelease:
-            if self.worker.state not in (M64EMU_RUNNING, M64EMU_PAUSED):
-                return False
-            key = event.key()
-            if key in QT2SDL2:
-                self.worker.send_sdl_keyup(QT2SDL2[key])
-            return True
-
-        return super().eventFilter(source, event)
+    def keyPressEvent(self, event):
+        if self.worker.state not in (M64EMU_RUNNING, M64EMU_PAUSED):
+            super().keyPressEvent(event)
+            return
+        key = event.key()
+        if event.modifiers().value & _ALT_MODIFIER and (key == _KEY_ENTER or key == _KEY_RETURN):
+            self.toggle_fs.emit()
+        else:
+            scancode = _QT2SDL2_INT.get(key)
+            if scancode is not None:
+                self.worker.send_sdl_keydown(scancode)
+
+    def keyReleaseEvent(self, event):
+        if self.worker.state not in (M64EMU_RUNNING, M64EMU_PAUSED):
+            super().keyReleaseEvent(event)
+            return
+        scancode = _QT2SDL2_INT.get(event.key())
+        if scancode is not None:
+            self.worker.send_sdl_keyup(scancode)
 
     def resizeEvent(self, event):
         event.ignore()
         size = event.size()
         if self.widgets_height:
-            width, height = size.width(), size.height()
-            self.window_size_triggered((width, height))
+            if not self._resizing:
+                self._resizing = True
+                self.stack.setUpdatesEnabled(False)
+            self._pending_size = (size.width(), size.height())
+            self._resize_timer.start()
         else:
             width, height = size.width(), size.height()
             self.resize(width, height)
 
+    @pyqtSlot()
+    def _apply_pending_resize(self):
+        """Applies the last size seen during a burst of resize events."""
+        if self._pending_size:
+            size, self._pending_size = self._pending_size, None
+            self.window_size_triggered(size)
+        if self._resizing:
+            self._resizing = False
+            self.stack.setUpdatesEnabled(True)
+
     def window_size_triggered(self, size):
         width, height = size
+        screen_size = (width, height - self.widgets_height)
         if self.vidext and self.worker.core.get_handle():
-            self.worker.core.config.open_section("Video-General")
-            self.worker.core.config.set_parameter("ScreenWidth", width)
-            self.worker.core.config.set_parameter("ScreenHeight", height - self.widgets_height)
-
-            video_size = ((int(width * self.devicePixelRatio()) << 16) +
-                          (int(height * self.devicePixelRatio()) - self.widgets_height))
+            if screen_size != self._last_video_size:
+                self._last_video_size = screen_size
+                config = self.worker.core.config
+                config.open_section("Video-General")
+                config.set_parameter("ScreenWidth", width)
+                config.set_parameter("ScreenHeight", height - self.widgets_height)
+
+            dpr = self.devicePixelRatio()
+            video_size = (int(width * dpr) << 16) + (int(height * dpr) - self.widgets_height)
             if self.worker.state in (M64EMU_RUNNING, M64EMU_PAUSED):
                 self.worker.core_state_set(M64CORE_VIDEO_SIZE, video_size)
 
-        self.set_sizes((width, height - self.widgets_height))
-        self.settings.qset.setValue("size", (width, height - self.widgets_height))
+        self.set_sizes(screen_size)
+        self.settings.qset.setValue("size", screen_size)
 
         self.resize(width, height)
         self.stack.currentWidget().activateWindow()
 
+    def clear_core_cache(self):
+        """Forgets values cached from the core config."""
+        self._last_video_size = None
+        self._user_data_save_dir = None
+
     def set_sizes(self, size):
         """Sets 'Window Size' radio buttons on resize event."""
-        width, height = size
-        if size in self.sizes.keys():
-            self.sizes[(width, height)].setChecked(True)
-        else:
-            for action in self.sizes.values():
+        action = self.sizes.get(size)
+        if action is not None:
+            action.setChecked(True)
+            return
+        for action in self._size_actions_tuple:
+            if action.isChecked():
                 action.setChecked(False)
+                break
 
     def center_widget(self):
         """Centers widget on desktop."""
@@ -181,23 +221,28 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         desktop = self.screen().geometry()
         width, height = size.width(), size.height()
         dwidth, dheight = desktop.width(), desktop.height()
-        cw, ch = (dwidth/2)-(width/2), (dheight/2)-(height/2)
-        self.move(int(cw), int(ch))
+        self.move((dwidth - width) >> 1, (dheight - height) >> 1)
 
     def connect_signals(self):
         """Connects signals."""
-        self.rom_opened.connect(self.on_rom_opened)
-        self.rom_closed.connect(self.on_rom_closed)
-        self.file_open.connect(self.on_file_open)
-        self.file_opening.connect(self.on_file_opening)
-        self.set_caption.connect(self.on_set_caption)
+        # Emitted only from the GUI thread. archive_dialog must also run
+        # before the worker starts, since it sets the file to load.
+        direct = Qt.ConnectionType.DirectConnection
+        self.file_open.connect(self.on_file_open, type=direct)
+        self.info_dialog.connect(self.on_info_dialog, type=direct)
+        self.archive_dialog.connect(self.on_archive_dialog, type=direct)
+        # Emitted only from the worker thread or from core video extension callbacks.
+        queued = Qt.ConnectionType.QueuedConnection
+        self.rom_opened.connect(self.on_rom_opened, type=queued)
+        self.rom_closed.connect(self.on_rom_closed, type=queued)
+        self.file_opening.connect(self.on_file_opening, type=queued)
+        self.set_caption.connect(self.on_set_caption, type=queued)
+        self.vidext_init.connect(self.on_vidext_init, type=queued)
+        self.vidext_set_mode.connect(self.on_vidext_set_mode, type=queued)
+        self.vidext_quit.connect(self.on_vidext_quit, type=queued)
+        # Emitted from both, so let Qt pick per emission.
         self.state_changed.connect(self.on_state_changed)
-        self.info_dialog.connect(self.on_info_dialog)
-        self.archive_dialog.connect(self.on_archive_dialog)
         self.toggle_fs.connect(self.on_toggle_fs)
-        self.vidext_init.connect(self.on_vidext_init)
-        self.vidext_set_mode.connect(self.on_vidext_set_mode)
-        self.vidext_quit.connect(self.on_vidext_quit)
         QApplication.instance().applicationStateChanged.connect(self.on_app_state_changed)
 
     def create_widgets(self):
@@ -226,14 +271,20 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         group.setExclusive(True)
         for slot in range(10):
             self.slots[slot] = QAction(self)
+            self.slots[slot].setData(slot)
             self.slots[slot].setCheckable(True)
             self.slots[slot].setText("Slot %d" % slot)
             self.slots[slot].setShortcut(QKeySequence(str(slot)))
             self.slots[slot].setActionGroup(group)
             self.menuStateSlot.addAction(self.slots[slot])
         self.slots[0].setChecked(True)
-        for slot, action in self.slots.items():
-            action.triggered.connect(lambda t, s=slot: self.worker.state_set_slot(s))
+        for action in self.slots.values():
+            action.triggered.connect(self._on_state_slot_triggered)
+
+    @pyqtSlot(bool)
+    def _on_state_slot_triggered(self, checked):
+        """Sets save slot stored in the action."""
+        self.worker.state_set_slot(self.sender().data())
 
     def create_size_actions(self):
         """Creates window size actions."""
@@ -247,23 +298,46 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             w, h = width, height+self.widgets_height
             action.setText("%dX" % num)
             action.setToolTip("%sx%s" % (width, height))
-            action.triggered.connect(lambda t, wi=w, he=h: self.resize(wi, he))
+            action.setData((w, h))
+            action.triggered.connect(self._on_size_action_triggered)
+
+    @pyqtSlot(bool)
+    def _on_size_action_triggered(self, checked):
+        """Resizes window to the size stored in the action."""
+        width, height = self.sender().data()
+        self.resize(width, height)
+
+    def _save_dir(self):
+        """Returns save states directory."""
+        if self._user_data_save_dir is None:
+            self._user_data_save_dir = os.path.join(
+                self.worker.core.config.get_path("UserData"), "save")
+        return self._user_data_save_dir
 
     def update_status(self, status):
         """Updates label in status bar."""
-        self.statusbar_label.setText(status)
+        self._pending_status = status
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    @pyqtSlot()
+    def _flush_status(self):
+        """Writes the last pending status to the status bar label."""
+        self.statusbar_label.setText(self._pending_status)
 
+    @pyqtSlot()
     def wait_for_initialize(self):
-        """Wait up to 10 seconds for core initialization, checking once a second.
+        """Wait up to 10 seconds for core initialization, backing off from 50 ms to once a second.
            If not yet initialized, start another QTimer. Else, toggle UI actions."""
         if self.worker.core_state_query(M64CORE_EMU_STATE) == M64EMU_STOPPED:
             self._initialize_attempt += 1
-            if self._initialize_attempt < 10:
-                QTimer.singleShot(1000, self.wait_for_initialize)
+            if self._initialize_attempt < len(_INITIALIZE_DELAYS):
+                QTimer.singleShot(_INITIALIZE_DELAYS[self._initialize_attempt], self.wait_for_initialize)
         else:
             self.window_size_triggered((self.width(), self.height()))
             self.worker.toggle_actions()
 
+    @pyqtSlot(int, name="handle_vidext_init")
     def on_vidext_init(self, mode):
         if mode == M64P_RENDER_OPENGL:
             self.stack.setCurrentIndex(1)
@@ -271,16 +345,19 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             self.stack.setCurrentIndex(2)
         self.stack.currentWidget().activateWindow()
 
+    @pyqtSlot(QOpenGLContext, name="handle_vidext_set_mode")
     def on_vidext_set_mode(self, context):
         context.doneCurrent()
         context.create()
         context.moveToThread(self.worker)
         self._initialized = True
 
+    @pyqtSlot(name="handle_vidext_quit")
     def on_vidext_quit(self):
         if self.isFullScreen():
             self.toggle_fs.emit()
 
+    @pyqtSlot(Qt.ApplicationState, name="handle_app_state_changed")
     def on_app_state_changed(self, state):
         if not bool(self.settings.get_int_safe("pause_on_focus_loss", 1)):
             return
@@ -294,6 +371,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             self.stack.currentWidget().activateWindow()
             self.worker.core.resume()
 
+    @pyqtSlot(name="handle_toggle_fs")
     def on_toggle_fs(self):
         if self.isFullScreen():
             self.menubar.show()
@@ -311,12 +389,15 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                 self.vkwidget.setCursor(Qt.CursorShape.BlankCursor)
         self.setWindowState(self.windowState() ^ Qt.WindowState.WindowFullScreen)
 
+    @pyqtSlot(name="handle_file_open")
+    @pyqtSlot(str, str, name="handle_file_open")
     def on_file_open(self, filepath=None, filename=None):
         """Opens ROM file."""
         if not filepath:
             action = self.sender()
             filepath = action.data()
         if not os.path.isfile(filepath):
+            from m64py.frontend.dialogs import InfoDialog
             InfoDialog(self, "File %s not found." % filepath).exec()
             return
         self.worker.core_state_query(M64CORE_EMU_STATE)
@@ -326,23 +407,29 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.worker.start()
         self.raise_()
 
+    @pyqtSlot(str, name="handle_file_opening")
     def on_file_opening(self, filepath):
         """Updates status on file opening."""
         self.update_status("Loading %s..." % (
             os.path.basename(filepath)))
 
+    @pyqtSlot(str, name="handle_set_caption")
     def on_set_caption(self, title):
         """Sets window title."""
         self.setWindowTitle(title)
 
+    @pyqtSlot(str, name="handle_info_dialog")
     def on_info_dialog(self, info):
         """Shows info dialog."""
+        from m64py.frontend.dialogs import InfoDialog
         self.settings.show_page(0)
         self.settings.raise_()
         InfoDialog(self.settings, info)
 
+    @pyqtSlot(list, name="handle_archive_dialog")
     def on_archive_dialog(self, files):
         """Shows archive dialog."""
+        from m64py.frontend.dialogs import ArchiveDialog
         archive = ArchiveDialog(self, files)
         rval = archive.exec()
         if rval == QDialog.DialogCode.Accepted:
@@ -350,40 +437,54 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             fname = curr_item.data(Qt.ItemDataRole.UserRole)
             self.worker.filename = fname
 
+    @pyqtSlot(tuple, name="handle_state_changed")
     def on_state_changed(self, states):
         """Toggles actions state."""
+        if states == self._last_state_tuple:
+            return
+        self._last_state_tuple = states
         load, pause, action, cheats = states
-        self.menuLoad.setEnabled(load)
-        self.menuRecent.setEnabled(load)
-        self.menuStateSlot.setEnabled(load)
-        self.actionLoadState.setEnabled(action)
-        self.actionSaveState.setEnabled(action)
-        self.actionLoadFrom.setEnabled(action)
-        self.actionSaveAs.setEnabled(action)
-        self.actionSaveScreenshot.setEnabled(action)
-        self.actionShowROMInfo.setEnabled(action)
-        self.actionMute.setEnabled(action)
-        self.actionStop.setEnabled(action)
-        self.actionReset.setEnabled(action)
-        self.actionSoftReset.setEnabled(action)
-        self.actionLimitFPS.setEnabled(action)
-        self.actionSlowDown.setEnabled(action)
-        self.actionSpeedUp.setEnabled(action)
-        self.actionFullscreen.setEnabled(action)
-        self.actionCheats.setEnabled(cheats)
-        self.actionPause.setEnabled(pause)
-        self.actionPaths.setEnabled(not action)
-        self.actionEmulator.setEnabled(not action)
-        self.actionGraphics.setEnabled(not action)
-        self.actionPlugins.setEnabled(not action)
-
+        self.menubar.setUpdatesEnabled(False)
+        try:
+            self.menuLoad.setEnabled(load)
+            self.menuRecent.setEnabled(load)
+            self.menuStateSlot.setEnabled(load)
+            self.actionLoadState.setEnabled(action)
+            self.actionSaveState.setEnabled(action)
+            self.actionLoadFrom.setEnabled(action)
+            self.actionSaveAs.setEnabled(action)
+            self.actionSaveScreenshot.setEnabled(action)
+            self.actionShowROMInfo.setEnabled(action)
+            self.actionMute.setEnabled(action)
+            self.actionStop.setEnabled(action)
+            self.actionReset.setEnabled(action)
+            self.actionSoftReset.setEnabled(action)
+            self.actionLimitFPS.setEnabled(action)
+            self.actionSlowDown.setEnabled(action)
+            self.actionSpeedUp.setEnabled(action)
+            self.actionFullscreen.setEnabled(action)
+            self.actionCheats.setEnabled(cheats)
+            self.actionPause.setEnabled(pause)
+            self.actionPaths.setEnabled(not action)
+            self.actionEmulator.setEnabled(not action)
+            self.actionGraphics.setEnabled(not action)
+            self.actionPlugins.setEnabled(not action)
+        finally:
+            self.menubar.setUpdatesEnabled(True)
+
+    @pyqtSlot(name="handle_rom_opened")
     def on_rom_opened(self):
         if not self.cheats:
+            from m64py.frontend.cheat import Cheat
             self.cheats = Cheat(self)
+            # Cheat disables actionCheats itself, so reapply the next state
+            self._last_state_tuple = None
         self.update_status(self.worker.core.rom_settings.goodname.decode())
         """Use QTimer to wait for core initialization before toggling UI actions"""
-        QTimer.singleShot(1000, self.wait_for_initialize)
+        self._initialize_attempt = 0
+        QTimer.singleShot(_INITIALIZE_DELAYS[0], self.wait_for_initialize)
 
+    @pyqtSlot(name="handle_rom_closed")
     def on_rom_closed(self):
         self.stack.setCurrentIndex(0)
         self.actionMute.setChecked(False)
@@ -398,10 +499,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     @pyqtSlot()
     def on_actionManually_triggered(self):
         """Shows ROM file dialog."""
-        dialog = QFileDialog()
-        dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
         last_dir = self.settings.qset.value("last_dir")
-        file_path, _ = dialog.getOpenFileName(
+        file_path, _ = QFileDialog.getOpenFileName(
                 self, self.tr("Load ROM Image"), last_dir,
                 "Nintendo64 ROM (%s);;All files (*)" % EXT_FILTER)
         if file_path:
@@ -412,11 +511,13 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     @pyqtSlot()
     def on_actionFromList_triggered(self):
         """Shows ROM list."""
+        from m64py.frontend.romlist import ROMList
         ROMList(self)
 
     @pyqtSlot()
     def on_actionShowROMInfo_triggered(self):
         """Shows ROM information."""
+        from m64py.frontend.rominfo import RomInfo
         RomInfo(self)
 
     @pyqtSlot()
@@ -432,11 +533,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     @pyqtSlot()
     def on_actionLoadFrom_triggered(self):
         """Loads state from file."""
-        dialog = QFileDialog()
-        dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
-        file_path, _ = dialog.getOpenFileName(
-            self, self.tr("Load State From File"),
-            os.path.join(self.worker.core.config.get_path("UserData"), "save"),
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, self.tr("Load State From File"), self._save_dir(),
             "M64P/PJ64 Saves (*.st* *.m64p *.zip *.pj);;All files (*)")
         if file_path:
             self.worker.state_load(file_path)
@@ -444,10 +542,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     @pyqtSlot()
     def on_actionSaveAs_triggered(self):
         """Saves state to file."""
-        dialog = QFileDialog()
-        file_path, file_filter = dialog.getSaveFileName(
-            self, self.tr("Save State To File"),
-            os.path.join(self.worker.core.config.get_path("UserData"), "save"),
+        file_path, file_filter = QFileDialog.getSaveFileName(
+            self, self.tr("Save State To File"), self._save_dir(),
             ";;".join([save_filter for save_filter, save_ext in M64P_SAVES.values()]),
             M64P_SAVES[M64SAV_M64P][0])
         if file_path:
@@ -537,11 +633,13 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     @pyqtSlot()
     def on_actionAbout_triggered(self):
         """Shows about dialog."""
+        from m64py.frontend.dialogs import AboutDialog
         AboutDialog(self)
 
     @pyqtSlot()
     def on_actionLicense_triggered(self):
         """Shows license dialog."""
+        from m64py.frontend.dialogs import LicenseDialog
         LicenseDialog(self)
 
     @pyqtSlot()
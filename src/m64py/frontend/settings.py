@@ -337,6 +337,7 @@ class Settings(QDialog, Ui_Settings):
             width, height = self.comboResolution.currentText().split("x")
         self.core.config.set_parameter("ScreenWidth", int(width))
         self.core.config.set_parameter("ScreenHeight", int(height))
+        self.parent.clear_core_cache()
         self.core.config.set_parameter("Fullscreen", self.checkFullscreen.isChecked())
         self.core.config.set_parameter("VerticalSync", self.checkVsync.isChecked())
 
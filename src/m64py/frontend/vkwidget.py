@@ -26,3 +26,9 @@ class VKWidget(QWindow):
 
     def mouseDoubleClickEvent(self, event):
         self.parent.toggle_fs.emit()
+
+    def keyPressEvent(self, event):
+        self.parent.keyPressEvent(event)
+
+    def keyReleaseEvent(self, event):
+        self.parent.keyReleaseEvent(event)
@@ -89,6 +89,7 @@ class Worker(QThread):
             if not self.library_path:
                 self.library_path = find_library(CORE_NAME)
         self.core.core_load(self.library_path)
+        self.parent.clear_core_cache()
 
     def core_unload(self):
         """Unloads core library."""